@@ -4,16 +4,23 @@ Analyze gold standard entries for consistency and provide recommendations
 for human raters to improve alignment with automated extraction.
 """
 import json
+import re
 import urllib.request
 import csv
+import gzip
+import heapq
 import sys
 from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Set, Tuple
 
 # Set UTF-8 encoding for Windows terminal
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
+# Author+year prefix of a study ID or paper file name, e.g. "Taylor2014_JNeuro" -> ("Taylor", "2014")
+_AUTHOR_YEAR_RE = re.compile(r'^([A-Za-z]+)(\d{4})')
+
 # Synonym mapping from validator
 VALUE_SYNONYMS = {
     'feedback_type': {
@@ -34,20 +41,41 @@ VALUE_SYNONYMS = {
     },
 }
 
+def _build_synonym_lookup(value_synonyms: Dict) -> Dict[str, Dict[str, str]]:
+    """
+    Map each parameter's lowercased synonyms and canonical terms to the canonical value.
+    Earlier canonicals win on overlap, matching the order they are listed in.
+    """
+    lookup = {}
+    for parameter, canonicals in value_synonyms.items():
+        terms = lookup[parameter] = {}
+        for canonical, synonyms in canonicals.items():
+            for term in synonyms + [canonical]:
+                terms.setdefault(term.lower(), canonical)
+    return lookup
+
+_SYNONYM_LOOKUP = _build_synonym_lookup(VALUE_SYNONYMS)
+
+# Empty/unknown sentinels. normalize_value matches the raw value case-sensitively
+# (so 'NULL' or 'n/a' from the extractor still count as values to compare),
+# while gold cells are lowercased first and any casing of a sentinel is skipped.
+_EMPTY_VALUES_EXACT = frozenset(['?', 'null', 'none', '', 'N/A'])
+_EMPTY_VALUES_LOWER = frozenset(value.lower() for value in _EMPTY_VALUES_EXACT)
+
+# Gold standard columns that describe the study rather than a design parameter
+_METADATA_FIELDS = frozenset({'study_id', 'title', 'authors', 'year', 'doi_or_url', 'lab', 'dataset_link', 'notes'})
+
+@lru_cache(maxsize=None)
 def normalize_value(value: str, parameter: str = None) -> str:
-    """Normalize a value for comparison."""
-    if not value or value in ['?', 'null', 'none', '', 'N/A']:
+    """Normalize a value for comparison (memoized: values repeat across studies)."""
+    if not value or value in _EMPTY_VALUES_EXACT:
         return None
     
     val = value.strip().lower()
     
     # Check synonyms if parameter is specified
-    if parameter and parameter in VALUE_SYNONYMS:
-        for canonical, synonyms in VALUE_SYNONYMS[parameter].items():
-            if val in [s.lower() for s in synonyms]:
-                return canonical
-            if val == canonical.lower():
-                return canonical
+    if parameter and parameter in _SYNONYM_LOOKUP:
+        return _SYNONYM_LOOKUP[parameter].get(val, val)
     
     return val
 
@@ -57,14 +85,25 @@ def load_gold_standard() -> List[Dict]:
     gid = "486594143"
     csv_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/export?format=csv&gid={gid}"
     
-    with urllib.request.urlopen(csv_url) as response:
-        content = response.read().decode('utf-8')
+    request = urllib.request.Request(csv_url, headers={'Accept-Encoding': 'gzip'})
+    with urllib.request.urlopen(request) as response:
+        raw = response.read()
+        if response.headers.get('Content-Encoding') == 'gzip':
+            raw = gzip.decompress(raw)
+        content = raw.decode('utf-8')
     
     lines = content.splitlines()
-    reader = csv.DictReader(lines)
+    reader = csv.reader(lines)
+    # Intern column names: every entry dict shares them and they are looked up per cell
+    headers = [sys.intern(h) for h in next(reader, [])]
+    n_cols = len(headers)
     entries = []
     for row in reader:
-        entry = {k: v.strip() if v else None for k, v in row.items()}
+        if not row:
+            continue
+        if len(row) < n_cols:
+            row += [None] * (n_cols - len(row))
+        entry = {k: v.strip() if v else None for k, v in zip(headers, row)}
         if entry.get('study_id'):  # Only include rows with study_id
             entries.append(entry)
     
@@ -95,8 +134,7 @@ def load_automated_results() -> Dict:
                 # Store with various keys
                 lookup[base_name] = exp
                 # Try to extract author+year pattern
-                import re
-                match = re.match(r'^([A-Za-z]+)(\d{4})', base_name)
+                match = _AUTHOR_YEAR_RE.match(base_name)
                 if match:
                     author_year = f"{match.group(1)}{match.group(2)}"
                     lookup[author_year] = exp
@@ -116,50 +154,56 @@ def analyze_value_mismatches(gold_entries: List[Dict], auto_results: Dict) -> Di
         'missing_in_gold': defaultdict(int),
     }
     
-    metadata_fields = {'study_id', 'title', 'authors', 'year', 'doi_or_url', 'lab', 'dataset_link', 'notes'}
+    # Lowercase the result keys once, and remember the match for each author/year
+    # (studies from one paper, e.g. Butcher2018EXP1/EXP2, share it)
+    auto_keys_lower = [(key.lower(), key) for key in auto_results]
+    author_year_matches = {}
+    auto_params_by_key = {}
     
     for gold_entry in gold_entries:
         study_id = gold_entry['study_id']
         
         # Try to find matching automated result
         # Extract author and year from study_id (e.g., "Butcher2018EXP1" -> "Butcher" "2018")
-        import re
-        match = re.match(r'^([A-Za-z]+)(\d{4})', study_id)
+        match = _AUTHOR_YEAR_RE.match(study_id)
         if not match:
             continue
         
         gold_author = match.group(1).lower()
         gold_year = match.group(2)
         
-        # Try exact match first, then partial matches
+        # Look for the first key containing both author and year
+        author_year = (gold_author, gold_year)
+        if author_year not in author_year_matches:
+            author_year_matches[author_year] = next(
+                (key for key_lower, key in auto_keys_lower
+                 if gold_author in key_lower and gold_year in key_lower),
+                None)
+        matched_key = author_year_matches[author_year]
         auto_exp = None
-        
-        # Look for keys containing both author and year
-        for key, exp in auto_results.items():
-            key_lower = key.lower()
-            # Check if both author and year are in the key
-            if gold_author in key_lower and gold_year in key_lower:
-                auto_exp = exp
-                print(f"   Matched {study_id} -> {key}")
-                break
+        if matched_key is not None:
+            auto_exp = auto_results[matched_key]
+            print(f"   Matched {study_id} -> {matched_key}")
         
         if not auto_exp:
             print(f"   ⚠️  No match for {study_id}")
             continue
         
-        # Extract automated parameters
-        auto_params = {}
-        for name, data in auto_exp.get('parameters', {}).items():
-            value = data.get('value') if isinstance(data, dict) else data
-            auto_params[name] = value
+        # Extract automated parameters (once per matched result)
+        auto_params = auto_params_by_key.get(matched_key)
+        if auto_params is None:
+            auto_params = auto_params_by_key[matched_key] = {
+                name: data.get('value') if isinstance(data, dict) else data
+                for name, data in auto_exp.get('parameters', {}).items()
+            }
         
         # Compare each parameter
         for param_name, gold_value in gold_entry.items():
-            if param_name in metadata_fields:
+            if param_name in _METADATA_FIELDS:
                 continue
             
             # Skip empty/unknown gold values
-            if not gold_value or gold_value.lower() in ['?', 'null', 'none', '', 'n/a']:
+            if not gold_value or gold_value.lower() in _EMPTY_VALUES_LOWER:
                 continue
             
             auto_value = auto_params.get(param_name)
@@ -169,21 +213,22 @@ def analyze_value_mismatches(gold_entries: List[Dict], auto_results: Dict) -> Di
                 continue
             
             # Normalize both values
+            auto_str = str(auto_value)
             norm_gold = normalize_value(gold_value, param_name)
-            norm_auto = normalize_value(str(auto_value), param_name)
+            norm_auto = normalize_value(auto_str, param_name)
             
             if norm_gold != norm_auto:
                 analysis['parameter_mismatches'][param_name].append({
                     'study_id': study_id,
                     'gold': gold_value,
-                    'auto': str(auto_value),
+                    'auto': auto_str,
                     'norm_gold': norm_gold,
                     'norm_auto': norm_auto,
                 })
                 
                 # Track terminology differences
                 if norm_gold and norm_auto:
-                    analysis['terminology_issues'][param_name].add((gold_value, str(auto_value)))
+                    analysis['terminology_issues'][param_name].add((gold_value, auto_str))
     
     return analysis
 
@@ -291,8 +336,9 @@ def print_recommendations(analysis: Dict):
     print("\n" + "="*80)
     print("📋 PARAMETERS FREQUENTLY MISSING IN AUTOMATED EXTRACTION:")
     print("   (These may need better extraction patterns)")
-    missing_sorted = sorted(analysis['missing_in_auto'].items(), key=lambda x: x[1], reverse=True)
-    for param, count in missing_sorted[:10]:
+    # Only the top 10 are shown, so select them rather than sorting everything
+    missing_top = heapq.nlargest(10, analysis['missing_in_auto'].items(), key=lambda x: x[1])
+    for param, count in missing_top:
         print(f"      {param}: {count} instances")
     
     print("\n" + "="*80)
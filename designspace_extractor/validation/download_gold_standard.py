@@ -3,6 +3,7 @@
 Download gold standard from Google Sheets to local CSV file.
 Run this on a machine with internet access (e.g., login node) before running validation on compute nodes.
 """
+import gzip
 import urllib.request
 import sys
 import os
@@ -17,8 +18,13 @@ def download_gold_standard(spreadsheet_id, gid, output_file):
     print(f"   Output: {output_file}")
     
     try:
-        with urllib.request.urlopen(csv_url) as response:
-            content = response.read().decode('utf-8')
+        # Ask for a gzip-compressed transfer; Google serves the export compressed when asked
+        request = urllib.request.Request(csv_url, headers={'Accept-Encoding': 'gzip'})
+        with urllib.request.urlopen(request) as response:
+            raw = response.read()
+            if response.headers.get('Content-Encoding') == 'gzip':
+                raw = gzip.decompress(raw)
+            content = raw.decode('utf-8')
         
         # Create output directory if needed
         output_path = Path(output_file)
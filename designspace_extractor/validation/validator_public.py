@@ -1,13 +1,29 @@
 #!/usr/bin/env python3
 """Validation Engine - Compare automated extraction to gold standard from public Google Sheet."""
+import io
 import json
+import os
 import sys
 import re
 import csv
+import gzip
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+import urllib.error
 import urllib.request
 
+import numpy as np
+
+# Optional fast JSON parser for large batch results files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Set UTF-8 encoding for Windows terminal
 if sys.platform == 'win32':
     try:
@@ -16,6 +32,41 @@ if sys.platform == 'win32':
         pass
 
 
+# Precompiled patterns used in the per-comparison hot path
+_SPACE_RE = re.compile(r'\s+')
+_WORD_RE = re.compile(r'\w+')
+_NUM_RE = re.compile(r'[-+]?\d*\.?\d+')
+_ID_RE = re.compile(r'^([A-Za-z]+).*?(\d{4})')
+_GOLD_ID_RE = re.compile(r'^([A-Za-z]+)(\d{4})')
+_DOI_PREFIX_RE = re.compile(r'https?://|(?:dx\.)?doi\.org/|DOI ')
+
+# Characters treated as word separators when normalizing values
+_PUNCT_TABLE = str.maketrans({c: ' ' for c in '-_/°()[]'})
+
+# Common typos tolerated by fuzzy_match: (correct spelling, typo)
+_TYPO_PAIRS = (
+    ('horizontal', 'horiztonal'),
+    ('continuous', 'continous'),
+    ('endpoint', 'end point'),
+)
+
+# Common stop words that don't affect meaning in word-based matching
+_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with'})
+
+# Values shorter than this are interned at load time; parameter names always are
+_INTERN_MAX_LEN = 32
+
+# Google Sheets CSV exports are cached here with their ETag for conditional re-fetches
+_GOLD_CACHE_DIR = Path.home() / '.cache'
+
+# Descriptive columns that are never scored ('lab' excluded per user request)
+_METADATA_PARAMS = frozenset({'study_id', 'title', 'authors', 'year', 'notes', 'doi_or_url', 'lab', 'dataset_link'})
+
+# Gold cell values that mean 'not annotated'
+_EMPTY_VALUES = frozenset({'null', 'none', '', 'n/a', '?'})
+_EMPTY_MAX_LEN = max(len(v) for v in _EMPTY_VALUES)
+
+
 # Parameter name mapping: automated_name -> gold_standard_name
 PARAM_NAME_MAPPING = {
     # Magnitude/rotation parameters
@@ -91,6 +142,12 @@ VALUE_SYNONYMS = {
     },
 }
 
+# Flat synonym index built once: (parameter, gold_value) -> frozenset(standard value + synonyms)
+_SYN_INDEX = {
+    (param, standard_val.lower()): frozenset(s.lower() for s in synonyms) | {standard_val.lower()}
+    for param, mapping in VALUE_SYNONYMS.items()
+    for standard_val, synonyms in mapping.items()
+}
 
 
 def normalize_param_name(param_name):
@@ -98,28 +155,118 @@ def normalize_param_name(param_name):
     return PARAM_NAME_MAPPING.get(param_name, param_name)
 
 
-def values_are_synonyms(param_name, gold_val, auto_val):
-    """Check if two values are synonyms for a given parameter."""
-    if param_name not in VALUE_SYNONYMS:
-        return False
+def values_are_synonyms(param_name, g_lower, a_lower):
+    """Check if two values are synonyms for a given parameter.
     
-    g_lower = str(gold_val).lower().strip()
-    a_lower = str(auto_val).lower().strip()
+    Both values must already be lowercased and stripped (as in fuzzy_match).
+    """
+    # Gold must be a standard value; auto may be the standard value or a synonym
+    synonyms = _SYN_INDEX.get((param_name, g_lower))
+    return synonyms is not None and a_lower in synonyms
+
+
+def _intern_short(value):
+    """Intern short strings (categorical values repeat across studies); return others unchanged."""
+    if isinstance(value, str) and len(value) < _INTERN_MAX_LEN:
+        return sys.intern(value)
+    return value
+
+
+def _param_value(data):
+    """Bare value of a results parameter entry ({'value': ..., ...} or the value itself)."""
+    return data.get('value') if isinstance(data, dict) else data
+
+
+def _read_gold_rows(lines):
+    """Parse gold standard CSV lines into entries keyed by study_id.
     
-    # Check if gold value has synonyms and auto value matches one
-    for standard_val, synonyms in VALUE_SYNONYMS[param_name].items():
-        if standard_val.lower() == g_lower:
-            # Gold matches a standard value, check if auto is a synonym
-            if a_lower in [s.lower() for s in synonyms]:
-                return True
-            # Also check if auto matches the standard value
-            if a_lower == standard_val.lower():
-                return True
+    Uses csv.reader with the header read once; rows without a study_id are
+    skipped before any per-cell work. Missing trailing cells become None.
+    """
+    gold = {}
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if not header or 'study_id' not in header:
+        return gold
     
-    return False
+    header = [sys.intern(h) for h in header]
+    sid_idx = header.index('study_id')
+    width = len(header)
+    
+    for row in reader:
+        if sid_idx >= len(row) or not row[sid_idx].strip():
+            continue
+        
+        if len(row) < width:
+            row = row + [None] * (width - len(row))
+        # Clean up the row
+        entry = dict(zip(header, (_intern_short(v.strip()) if v else None for v in row)))
+        gold[entry['study_id']] = entry
+    
+    return gold
 
 
-def load_gold_standard_csv(spreadsheet_id=None, gid='0', local_file=None):
+def _open_gold_csv_url(csv_url, headers=None):
+    """
+    Request the CSV export with gzip transfer encoding.
+    
+    Returns (response, body) where body is a binary stream of the decoded CSV;
+    the caller closes response.
+    """
+    request = urllib.request.Request(csv_url, headers={'Accept-Encoding': 'gzip', **(headers or {})})
+    response = urllib.request.urlopen(request)
+    if response.headers.get('Content-Encoding') == 'gzip':
+        return response, gzip.GzipFile(fileobj=response)
+    return response, response
+
+
+def _fetch_gold_csv_cached(csv_url, cache_path):
+    """
+    Download the CSV export to cache_path unless the cached copy is still current.
+    
+    Sends If-None-Match with the stored ETag; a 304 response keeps the cached
+    file. Returns a binary stream of the up-to-date CSV. If the cache can't be
+    written (e.g. read-only home directory), warns and returns the downloaded
+    copy instead.
+    """
+    etag_path = cache_path.with_suffix('.etag')
+    headers = {}
+    if cache_path.exists() and etag_path.exists():
+        headers['If-None-Match'] = etag_path.read_text(encoding='utf-8').strip()
+    
+    try:
+        response, body = _open_gold_csv_url(csv_url, headers)
+        with response:
+            content = body.read()
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            raise
+        print(f"   Not modified since last fetch, using cached copy: {cache_path}")
+        return open(cache_path, 'rb')
+    
+    tmp_path = cache_path.with_suffix('.tmp')
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, cache_path)
+        
+        etag = response.headers.get('ETag')
+        if etag:
+            etag_path.write_text(etag, encoding='utf-8')
+        elif etag_path.exists():
+            etag_path.unlink()
+    except OSError as e:
+        print(f"   ⚠️  Could not update gold standard cache ({e}), using downloaded copy")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+    
+    return io.BytesIO(content)
+
+
+def load_gold_standard_csv(spreadsheet_id=None, gid='0', local_file=None, use_cache=True):
     """
     Load gold standard from Google Sheet CSV or local file.
     
@@ -127,6 +274,8 @@ def load_gold_standard_csv(spreadsheet_id=None, gid='0', local_file=None):
         spreadsheet_id: Google Sheets ID (for online mode)
         gid: Sheet GID (for online mode)
         local_file: Path to local CSV file (for offline mode)
+        use_cache: Reuse the cached Google Sheets export when the server reports
+            it unchanged (online mode)
     
     Returns:
         Dictionary of gold standard entries keyed by study_id
@@ -139,16 +288,8 @@ def load_gold_standard_csv(spreadsheet_id=None, gid='0', local_file=None):
         print(f"   Path: {local_file}")
         
         try:
-            with open(local_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                
-                for row in reader:
-                    # Clean up the row
-                    entry = {k: v.strip() if v else None for k, v in row.items()}
-                    
-                    study_id = entry.get('study_id')
-                    if study_id:
-                        gold[study_id] = entry
+            with open(local_file, 'r', encoding='utf-8', newline='') as f:
+                gold = _read_gold_rows(f)
             
             print(f"✅ Loaded {len(gold)} gold standard entries from local file")
             return gold
@@ -170,19 +311,15 @@ def load_gold_standard_csv(spreadsheet_id=None, gid='0', local_file=None):
         print(f"   URL: {csv_url}")
         
         try:
-            with urllib.request.urlopen(csv_url) as response:
-                content = response.read().decode('utf-8')
-            
-            lines = content.splitlines()
-            reader = csv.DictReader(lines)
-            
-            for row in reader:
-                # Clean up the row
-                entry = {k: v.strip() if v else None for k, v in row.items()}
-                
-                study_id = entry.get('study_id')
-                if study_id:
-                    gold[study_id] = entry
+            if use_cache:
+                cache_path = _GOLD_CACHE_DIR / f"godsreach_gold_{spreadsheet_id}_{gid}.csv"
+                with _fetch_gold_csv_cached(csv_url, cache_path) as csv_file:
+                    gold = _read_gold_rows(io.TextIOWrapper(csv_file, encoding='utf-8', newline=''))
+            else:
+                # Parse rows straight off the response stream instead of buffering the whole CSV
+                response, body = _open_gold_csv_url(csv_url)
+                with response:
+                    gold = _read_gold_rows(io.TextIOWrapper(body, encoding='utf-8', newline=''))
             
             print(f"✅ Loaded {len(gold)} gold standard entries")
             return gold
@@ -197,15 +334,32 @@ def load_gold_standard_csv(spreadsheet_id=None, gid='0', local_file=None):
     return {}
 
 
+def _parse_json(raw):
+    """Parse JSON bytes with orjson when available, else the stdlib json module."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which json.dump writes by default
+            pass
+    return json.loads(raw)
+
+
 def load_automated_results(file_path):
-    """Load automated results."""
+    """Load automated results.
+    
+    Returns (auto, auto_by_doi, auto_by_author_year): params keyed by study_id,
+    (study_id, params) keyed by DOI, and study_ids keyed by (author_lower, year).
+    """
     print(f"\n📥 Loading automated results from: {file_path}")
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        results = json.load(f)
+    with open(file_path, 'rb') as f:
+        results = _parse_json(f.read())
     
     auto = {}
-    auto_by_doi = {}  # For DOI-based matching
+    auto_by_doi = {}  # For DOI-based matching (full DOI and DOI suffix keys)
+    dois = set()
+    auto_by_author_year = defaultdict(list)  # For author+year fallback matching
     
     for res in results:
         if not res['success']:
@@ -214,42 +368,104 @@ def load_automated_results(file_path):
         extraction = res['extraction_result']
         experiments = extraction.get('experiments', [extraction])
         
+        base_id = extract_id(res['paper_name'])
         for idx, exp in enumerate(experiments, 1):
-            base_id = extract_id(res['paper_name'])
             study_id = f"{base_id}_EXP{idx}" if len(experiments) > 1 else base_id
             
             # Normalize parameter names to gold standard
-            params = {}
-            for name, data in exp.get('parameters', {}).items():
-                value = data.get('value') if isinstance(data, dict) else data
-                normalized_name = normalize_param_name(name)
-                params[normalized_name] = value
+            params = {
+                sys.intern(normalize_param_name(name)): _intern_short(_param_value(data))
+                for name, data in exp.get('parameters', {}).items()
+            }
             
             # Store by study_id
             auto[study_id] = params
             
+            id_match = _GOLD_ID_RE.search(study_id)
+            if id_match:
+                author, year = id_match.groups()
+                auto_by_author_year[(author.lower(), year)].append(study_id)
+            
             # Also store by DOI for flexible matching
             doi = params.get('doi_or_url', '')
             if doi and isinstance(doi, str):
-                # Clean DOI (remove https://, dx.doi.org/, etc.)
-                clean_doi = doi.replace('https://', '').replace('http://', '')
-                clean_doi = clean_doi.replace('dx.doi.org/', '').replace('doi.org/', '')
-                clean_doi = clean_doi.replace('DOI ', '').strip()
-                if clean_doi:
-                    auto_by_doi[clean_doi] = (study_id, params)
+                doi_keys = _doi_keys(doi)
+                if doi_keys:
+                    dois.add(doi_keys[0])
+                    for key in doi_keys:
+                        auto_by_doi[key] = (study_id, params)
     
     print(f"✅ Loaded {len(auto)} automated extraction results")
-    print(f"   ({len(auto_by_doi)} with DOI for flexible matching)")
-    return auto, auto_by_doi
+    print(f"   ({len(dois)} with DOI for flexible matching)")
+    return auto, auto_by_doi, auto_by_author_year
+
+
+def _clean_doi(doi):
+    """Strip URL/'DOI ' prefixes (https://, dx.doi.org/, etc.) in a single regex pass."""
+    return _DOI_PREFIX_RE.sub('', doi).strip()
+
+
+@lru_cache(maxsize=4096)
+def _doi_keys(doi):
+    """
+    Return the auto_by_doi lookup keys for a DOI or URL, most specific first.
+    
+    DOIs are case-insensitive, so keys are lowercased. For '10.x/...' DOIs the
+    registrant suffix (everything after the first '/') is added as a fallback
+    key, so the same article still matches when the two sides format the
+    prefix differently. The whole suffix is used, not the last path segment,
+    so landing-page tails such as '/full' or '/abstract' never become keys
+    shared across papers.
+    """
+    low = _clean_doi(doi).lower()
+    if not low:
+        return ()
+    if low.startswith('10.'):
+        suffix = low.split('/', 1)[1] if '/' in low else ''
+        if suffix:
+            return (low, suffix)
+    return (low,)
 
 
 def extract_id(paper_name):
     """Extract study ID from paper filename."""
     base = paper_name.replace('.pdf', '')
-    match = re.search(r'^([A-Za-z]+).*?(\d{4})', base)
+    match = _ID_RE.search(base)
     return f"{match.group(1)}{match.group(2)}" if match else base.split()[0]
 
 
+def _word_set(text):
+    """Return the meaningful words of normalized text (stop words removed).
+    
+    A single alphanumeric token is returned as-is without running the regex.
+    """
+    words = frozenset((text,)) if text.isalnum() else frozenset(_WORD_RE.findall(text))
+    return words - _STOP_WORDS
+
+
+# Per-value normalization shared by every comparison the value takes part in.
+# num is the parsed float when the value holds exactly one number.
+# correct_terms/typo_terms hold the indices of _TYPO_PAIRS whose correct
+# spelling/typo occurs in the normalized text.
+_NormalizedValue = namedtuple('_NormalizedValue', ['norm', 'words', 'nums', 'num', 'correct_terms', 'typo_terms'])
+
+
+@lru_cache(maxsize=50_000)
+def _normalize_value(text):
+    """Normalize a lowercased, stripped value once for all comparisons.
+    
+    norm maps underscores and common punctuation that doesn't affect meaning
+    to spaces and collapses whitespace; nums is only extracted when the value
+    contains a digit.
+    """
+    norm = _SPACE_RE.sub(' ', text.translate(_PUNCT_TABLE)).strip()
+    nums = tuple(_NUM_RE.findall(text)) if any(c.isdigit() for c in text) else ()
+    num = float(nums[0]) if len(nums) == 1 else None
+    correct_terms = frozenset(i for i, (correct, _) in enumerate(_TYPO_PAIRS) if correct in norm)
+    typo_terms = frozenset(i for i, (_, typo) in enumerate(_TYPO_PAIRS) if typo in norm)
+    return _NormalizedValue(norm, _word_set(norm), nums, num, correct_terms, typo_terms)
+
+
 def fuzzy_match(gold_val, auto_val, param_name=None):
     """
     Enhanced fuzzy matching with multiple strategies.
@@ -265,26 +481,28 @@ def fuzzy_match(gold_val, auto_val, param_name=None):
     if gold_val is None or auto_val is None:
         return False
     
-    g, a = str(gold_val).lower().strip(), str(auto_val).lower().strip()
+    # Fast path: identical values need no lowercasing or cache lookup
+    if gold_val is auto_val or (isinstance(gold_val, str) and isinstance(auto_val, str) and gold_val == auto_val):
+        return True
     
+    return _fuzzy_match_cached(str(gold_val).lower().strip(), str(auto_val).lower().strip(), param_name)
+
+
+@lru_cache(maxsize=200_000)
+def _fuzzy_match_cached(g, a, param_name):
+    """Match lowercased, stripped values; memoized since value vocabularies repeat across studies."""
     # 1. Exact match
     if g == a:
         return True
     
     # 2. Check parameter-specific synonyms first
-    if param_name and values_are_synonyms(param_name, gold_val, auto_val):
+    if param_name and values_are_synonyms(param_name, g, a):
         return True
     
-    # 3. Normalize text: remove underscores, extra spaces, punctuation
-    g_norm = re.sub(r'[_\s]+', ' ', g).strip()
-    a_norm = re.sub(r'[_\s]+', ' ', a).strip()
-    
-    # Remove common punctuation that doesn't affect meaning
-    for char in ['-', '_', '/', '°', '(', ')', '[', ']']:
-        g_norm = g_norm.replace(char, ' ')
-        a_norm = a_norm.replace(char, ' ')
-    g_norm = re.sub(r'\s+', ' ', g_norm).strip()
-    a_norm = re.sub(r'\s+', ' ', a_norm).strip()
+    # 3. Normalize text (cached per value, so a gold value is prepared once
+    # no matter how many automated values it is compared against)
+    g_pre, a_pre = _normalize_value(g), _normalize_value(a)
+    g_norm, a_norm = g_pre.norm, a_pre.norm
     
     # Match after normalization
     if g_norm == a_norm:
@@ -294,26 +512,14 @@ def fuzzy_match(gold_val, auto_val, param_name=None):
     if g in a or a in g or g_norm in a_norm or a_norm in g_norm:
         return True
     
-    # 5. Typo tolerance: check for common typos
-    typo_pairs = [
-        ('horizontal', 'horiztonal'),
-        ('continuous', 'continous'),
-        ('endpoint', 'end-point'),
-        ('endpoint', 'end point'),
-    ]
-    for correct, typo in typo_pairs:
-        if (correct in g_norm and typo in a_norm) or (typo in g_norm and correct in a_norm):
-            return True
+    # 5. Typo tolerance: one side has the correct spelling of a term the
+    # other side misspells (term scans are done once per value)
+    if (g_pre.correct_terms & a_pre.typo_terms) or (g_pre.typo_terms & a_pre.correct_terms):
+        return True
     
     # 6. Word-based matching for compound values
     # e.g., "aim_report" should match "reported aiming direction"
-    g_words = set(re.findall(r'\w+', g_norm))
-    a_words = set(re.findall(r'\w+', a_norm))
-    
-    # Remove common stop words that don't affect meaning
-    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with'}
-    g_words = g_words - stop_words
-    a_words = a_words - stop_words
+    g_words, a_words = g_pre.words, a_pre.words
     
     # If gold has multiple words and most are in auto, consider it a match
     if len(g_words) >= 2:
@@ -333,24 +539,18 @@ def fuzzy_match(gold_val, auto_val, param_name=None):
             return True
     
     # 8. Numeric match with tolerance (handles "45" vs "45.0", "30°" vs "30")
-    try:
-        # Extract all numbers from both strings
-        g_nums = re.findall(r'[-+]?\d*\.?\d+', g)
-        a_nums = re.findall(r'[-+]?\d*\.?\d+', a)
-        
-        if g_nums and a_nums:
-            # For single numbers, check if they're close
-            if len(g_nums) == 1 and len(a_nums) == 1:
-                g_num = float(g_nums[0])
-                a_num = float(a_nums[0])
-                # 5% tolerance for numeric values
-                if abs(g_num - a_num) / max(abs(g_num), 0.001) < 0.05:
-                    return True
-            # For multiple numbers, check if primary number matches
-            elif g_nums[0] == a_nums[0]:
+    # Numbers were extracted and parsed during normalization (empty for categorical values)
+    g_nums, a_nums = g_pre.nums, a_pre.nums
+    if g_nums and a_nums:
+        # For single numbers, check if they're close
+        if len(g_nums) == 1 and len(a_nums) == 1:
+            g_num, a_num = g_pre.num, a_pre.num
+            # 5% tolerance for numeric values
+            if abs(g_num - a_num) / max(abs(g_num), 0.001) < 0.05:
                 return True
-    except:
-        pass
+        # For multiple numbers, check if primary number matches
+        elif g_nums[0] == a_nums[0]:
+            return True
     
     # 9. Abbreviation matching
     abbreviations = {
@@ -368,24 +568,25 @@ def fuzzy_match(gold_val, auto_val, param_name=None):
     return False
 
 
+def _is_empty_gold(val):
+    """True if a gold cell is blank or a 'not annotated' sentinel.
+    
+    Values longer than the longest sentinel skip the lowercase call.
+    """
+    return not val or (len(val) <= _EMPTY_MAX_LEN and val.lower() in _EMPTY_VALUES)
+
+
 def compare_study(gold_params, auto_params):
     """Compare one study."""
-    metadata = {'study_id', 'title', 'authors', 'year', 'notes', 'doi_or_url', 'lab', 'dataset_link'}
-    all_params = set(gold_params.keys()) | set(auto_params.keys())
-    params = [p for p in all_params if p not in metadata]
-    
     tp, fp, fn, vm = [], [], [], []
     
-    for param in params:
-        gold_val = gold_params.get(param)
-        auto_val = auto_params.get(param)
-        
-        # Skip if gold is null/empty (not annotated) or if it's 'lab' (per user request)
-        if param == 'lab':
-            continue
-        if not gold_val or gold_val.lower() in ['null', 'none', '', 'n/a', '?']:
+    # Only annotated gold parameters can be TP/FN/VM, so walk the gold side once
+    for param, gold_val in gold_params.items():
+        # Skip metadata and parameters where gold is null/empty (not annotated)
+        if param in _METADATA_PARAMS or _is_empty_gold(gold_val):
             continue
         
+        auto_val = auto_params.get(param)
         if auto_val is None or auto_val == '':
             fn.append(param)  # False Negative: should have extracted
         elif fuzzy_match(gold_val, auto_val, param):  # Pass param_name for synonym checking
@@ -395,7 +596,7 @@ def compare_study(gold_params, auto_params):
     
     # Check for False Positives (extracted but not in gold)
     for param in auto_params:
-        if param not in metadata and param not in gold_params and param != 'lab':
+        if param not in _METADATA_PARAMS and param not in gold_params:
             fp.append(param)
     
     return {'tp': tp, 'fp': fp, 'fn': fn, 'vm': vm}
@@ -425,47 +626,50 @@ def calculate_metrics(all_results):
 
 def calculate_per_parameter_metrics(all_results, gold_data):
     """Calculate metrics per parameter."""
-    param_stats = defaultdict(lambda: {'tp': 0, 'fp': 0, 'fn': 0, 'vm': 0, 'total_gold': 0})
-    
-    for study_id, result in all_results.items():
-        for param in result['tp']:
-            param_stats[param]['tp'] += 1
-        for param in result['fp']:
-            param_stats[param]['fp'] += 1
-        for param in result['fn']:
-            param_stats[param]['fn'] += 1
-        for param in result['vm']:
-            param_stats[param]['vm'] += 1
+    # One Counter per category; Counter.update does the per-parameter increments
+    tp_counts, fp_counts, fn_counts, vm_counts = Counter(), Counter(), Counter(), Counter()
+    for result in all_results.values():
+        tp_counts.update(result['tp'])
+        fp_counts.update(result['fp'])
+        fn_counts.update(result['fn'])
+        vm_counts.update(result['vm'])
     
     # Count total gold annotations per parameter
-    metadata = {'study_id', 'title', 'authors', 'year', 'notes', 'doi_or_url', 'lab', 'dataset_link'}
-    for gold_params in gold_data.values():
-        for param, val in gold_params.items():
-            if param in metadata or param == 'lab':
-                continue
-            if val and val.lower() not in ['null', 'none', '', 'n/a', '?']:
-                param_stats[param]['total_gold'] += 1
+    gold_counts = Counter(
+        param
+        for gold_params in gold_data.values()
+        for param, val in gold_params.items()
+        if param not in _METADATA_PARAMS and not _is_empty_gold(val)
+    )
     
-    # Calculate metrics
-    param_metrics = {}
-    for param, stats in param_stats.items():
-        tp, fp, fn, vm = stats['tp'], stats['fp'], stats['fn'], stats['vm']
-        total_gold = stats['total_gold']
-        
-        precision = tp / (tp + fp + vm) if (tp + fp + vm) > 0 else 0
-        recall = tp / total_gold if total_gold > 0 else 0
-        f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0
-        
-        param_metrics[param] = {
-            'precision': precision,
-            'recall': recall,
-            'f1': f1,
-            'tp': tp,
-            'fp': fp,
-            'fn': fn,
-            'vm': vm,
-            'total_gold': total_gold
-        }
+    # Calculate metrics for all parameters in one vectorized pass
+    params = list(dict.fromkeys(chain(tp_counts, fp_counts, fn_counts, vm_counts, gold_counts)))
+    tp, fp, fn, vm, total_gold = (
+        np.fromiter((counts[param] for param in params), dtype=np.int64, count=len(params))
+        for counts in (tp_counts, fp_counts, fn_counts, vm_counts, gold_counts)
+    )
+    
+    predicted = tp + fp + vm
+    precision = np.divide(tp, predicted, out=np.zeros(len(params)), where=predicted > 0)
+    recall = np.divide(tp, total_gold, out=np.zeros(len(params)), where=total_gold > 0)
+    pr_sum = precision + recall
+    f1 = np.divide(2 * precision * recall, pr_sum, out=np.zeros(len(params)), where=pr_sum > 0)
+    
+    # Back to plain Python numbers for reporting
+    columns = {
+        'precision': precision.tolist(),
+        'recall': recall.tolist(),
+        'f1': f1.tolist(),
+        'tp': tp.tolist(),
+        'fp': fp.tolist(),
+        'fn': fn.tolist(),
+        'vm': vm.tolist(),
+        'total_gold': total_gold.tolist(),
+    }
+    param_metrics = {
+        param: {name: values[i] for name, values in columns.items()}
+        for i, param in enumerate(params)
+    }
     
     return param_metrics
 
@@ -501,12 +705,17 @@ def print_report(overall, per_param):
               f"{metrics['tp']:>4} {metrics['fp']:>4} {metrics['fn']:>4} {metrics['vm']:>4}")
 
 
-def match_studies(gold_data, auto_data, auto_by_doi):
+def match_studies(gold_data, auto_data, auto_by_doi, auto_by_author_year, verbose=False):
     """Match gold standard entries to automated results.
     
+    Per-match lines are only printed when verbose is set; otherwise a
+    single summary line is emitted after matching.
+    
     Returns dict mapping gold_study_id -> (auto_study_id, auto_params)
     """
     matches = {}
+    match_log = []
+    n_doi = n_author = 0
     
     print(f"\n🔗 Matching gold standard to automated results...")
     
@@ -514,28 +723,35 @@ def match_studies(gold_data, auto_data, auto_by_doi):
         # Strategy 1: Try DOI matching (most reliable)
         gold_doi = gold_params.get('doi_or_url', '')
         if gold_doi:
-            clean_doi = gold_doi.replace('https://', '').replace('http://', '')
-            clean_doi = clean_doi.replace('dx.doi.org/', '').replace('doi.org/', '')
-            clean_doi = clean_doi.replace('DOI ', '').strip()
+            doi_key = next((key for key in _doi_keys(gold_doi) if key in auto_by_doi), None)
             
-            if clean_doi in auto_by_doi:
-                auto_id, auto_params = auto_by_doi[clean_doi]
+            if doi_key:
+                auto_id, auto_params = auto_by_doi[doi_key]
                 matches[gold_id] = (auto_id, auto_params)
-                print(f"   ✅ {gold_id} → {auto_id} (via DOI: {clean_doi[:30]}...)")
+                n_doi += 1
+                if verbose:
+                    match_log.append(f"   ✅ {gold_id} → {auto_id} (via DOI: {doi_key[:30]}...)")
                 continue
         
         # Strategy 2: Try fuzzy study_id matching
         # Extract author/year from gold_id
-        match = re.search(r'^([A-Za-z]+)(\d{4})', gold_id)
+        match = _GOLD_ID_RE.search(gold_id)
         if match:
             author, year = match.groups()
             
-            # Look for matching auto_id with same author+year
-            for auto_id, auto_params in auto_data.items():
-                if author.lower() in auto_id.lower() and year in auto_id:
-                    matches[gold_id] = (auto_id, auto_params)
-                    print(f"   ✅ {gold_id} → {auto_id} (via author+year)")
-                    break
+            # Look for matching auto_id with same author+year (indexed at load time)
+            candidates = auto_by_author_year.get((author.lower(), year))
+            if candidates:
+                auto_id = candidates[0]
+                matches[gold_id] = (auto_id, auto_data[auto_id])
+                n_author += 1
+                if verbose:
+                    match_log.append(f"   ✅ {gold_id} → {auto_id} (via author+year)")
+    
+    if match_log:
+        # One write for the whole verbose log instead of a print per match
+        sys.stdout.write('\n'.join(match_log) + '\n')
+    print(f"   ✅ Matched {n_doi} studies via DOI, {n_author} via author+year")
     
     unmatched = set(gold_data.keys()) - set(matches.keys())
     if unmatched:
@@ -552,6 +768,9 @@ def main():
     parser.add_argument('--gid', default='486594143', help='Sheet GID (default: 486594143)')
     parser.add_argument('--local-file', help='Path to local gold standard CSV (for offline mode)')
     parser.add_argument('--results', required=True, help='Path to batch_processing_results.json')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always re-download the Google Sheet instead of reusing the cached export')
+    parser.add_argument('--verbose', action='store_true', help='Print each gold/auto study match')
     args = parser.parse_args()
     
     # Validate arguments
@@ -563,22 +782,32 @@ def main():
         return 1
     
     # Load data
-    gold_data = load_gold_standard_csv(
-        spreadsheet_id=args.spreadsheet_id,
-        gid=args.gid,
-        local_file=args.local_file
-    )
+    if args.local_file:
+        gold_data = load_gold_standard_csv(local_file=args.local_file)
+        auto_data, auto_by_doi, auto_by_author_year = load_automated_results(args.results)
+    else:
+        # Online mode: fetch the gold standard in a worker thread so the network
+        # round-trip overlaps with parsing the local results file
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            gold_future = executor.submit(
+                load_gold_standard_csv,
+                spreadsheet_id=args.spreadsheet_id,
+                gid=args.gid,
+                use_cache=not args.no_cache
+            )
+            auto_data, auto_by_doi, auto_by_author_year = load_automated_results(args.results)
+            gold_data = gold_future.result()
+    
     if not gold_data:
         print("❌ Failed to load gold standard")
         return 1
     
-    auto_data, auto_by_doi = load_automated_results(args.results)
     if not auto_data:
         print("❌ Failed to load automated results")
         return 1
     
     # Match studies
-    matches = match_studies(gold_data, auto_data, auto_by_doi)
+    matches = match_studies(gold_data, auto_data, auto_by_doi, auto_by_author_year, verbose=args.verbose)
     
     if not matches:
         print("\n❌ No matching studies found between gold standard and automated results")